@@ -0,0 +1,22 @@
+"""Compilación del núcleo opcional en C (src/_gff_stats.c)
+
+Los metadatos del proyecto están en pyproject.toml; este archivo solo declara
+la extensión, que setuptools compila con `pip install .` o, para usarla desde
+el árbol de trabajo (tests incluidos), con:
+
+    python setup.py build_ext --inplace
+
+optional=True: si no hay compilador de C, la instalación sigue adelante y
+gff_stats.py usa los otros motores.
+"""
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension(
+            "_gff_stats",
+            sources=["src/_gff_stats.c"],
+            optional=True,
+        ),
+    ],
+)
@@ -0,0 +1,130 @@
+"""Caché columnar en Parquet de los registros de un archivo GFF
+
+La primera ejecución con --cache recorre el GFF con el escáner Numba
+(_scan.parse_to_arrays, sin filtro) y guarda un registro por feature en un
+archivo Parquet comprimido con zstd:
+
+    type:   dictionary<int32, string>  tipo de feature
+    length: int64                      end - start + 1
+    strand: uint8                      byte del strand ("+", "-", ...) o 0
+
+El caché guarda en los metadatos del esquema de qué archivo sale (ruta
+absoluta, tamaño y mtime_ns). Las ejecuciones siguientes, mientras esos tres
+valores coincidan con los del GFF actual, no vuelven a leer el texto: cargan
+la tabla con pyarrow y calculan los acumuladores con un group_by por tipo
+(con el filtro que toque en cada ejecución). Si no coinciden, el caché se
+reconstruye.
+
+Requiere pyarrow, numpy y numba; si falta alguno, gff_stats.py no importa
+este módulo: compute_stats_from_gff() avisa con un RuntimeWarning y lee el
+texto, y el CLI termina con error.
+
+Expone:
+    compute(path, cache, filter_type=None) -> (counts, length_sums, strand_counts)
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from typing import Dict, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import _scan
+
+# Bytes de los strands que cuentan en la distribución
+_PLUS = 43  # "+"
+_MINUS = 45  # "-"
+
+
+def _source_metadata(path: str) -> Dict[bytes, bytes]:
+    """Identifica el GFF de origen: ruta absoluta, tamaño y mtime en ns."""
+    st = os.stat(path)
+    return {
+        b"gff_path": os.path.abspath(path).encode("utf-8"),
+        b"gff_size": str(st.st_size).encode(),
+        b"gff_mtime_ns": str(st.st_mtime_ns).encode(),
+    }
+
+
+def _is_fresh(cache: str, source: Dict[bytes, bytes]) -> bool:
+    """Indica si el caché existe y se construyó a partir de este mismo GFF."""
+    try:
+        metadata = pq.read_schema(cache).metadata or {}
+    except (FileNotFoundError, pa.ArrowInvalid):
+        # Sin caché, o un archivo que no es Parquet válido: reconstruir
+        return False
+    return all(metadata.get(key) == value for key, value in source.items())
+
+
+def _build_table(path: str, source: Dict[bytes, bytes]) -> pa.Table:
+    """Recorre el GFF completo (sin filtro) y devuelve sus registros como tabla."""
+    cols = _scan.parse_to_arrays(path)
+    types = pa.DictionaryArray.from_arrays(
+        pa.array(cols["type_id"], pa.int32()),
+        pa.array(cols["type_names"], pa.string()),
+    )
+    return pa.table({
+        "type": types,
+        "length": pa.array(cols["end"] - cols["start"] + 1, pa.int64()),
+        "strand": pa.array(cols["strand"], pa.uint8()),
+    }, metadata=source)
+
+
+def _write_table(table: pa.Table, cache: str) -> None:
+    """Escribe el caché en un temporal y lo renombra (nunca queda a medias).
+
+    El temporal tiene nombre único en el mismo directorio que el caché, para
+    que dos ejecuciones simultáneas no escriban el mismo archivo y os.replace
+    no cruce sistemas de archivos.
+    """
+    directory = os.path.dirname(os.path.abspath(cache))
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".parquet.tmp", delete=False) as fh:
+        tmp = fh.name
+    try:
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, cache)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp)
+        raise
+
+
+def compute(path: str, cache: str, filter_type: str | None = None) -> Tuple[Dict, Dict, Dict]:
+    """Calcula los acumuladores a partir del caché, creándolo si hace falta.
+
+    Devuelve (counts, length_sums, strand_counts) con el mismo formato que
+    _scan_gff() en gff_stats.py.
+    """
+    source = _source_metadata(path)
+    if _is_fresh(cache, source):
+        table = pq.read_table(cache)
+    else:
+        table = _build_table(path, source)
+        _write_table(table, cache)
+
+    if filter_type:
+        table = table.filter(pc.equal(table["type"], filter_type))
+
+    # Conteo y suma de longitudes por tipo; sin hilos, los grupos salen en orden
+    # de primera aparición, igual que en el recorrido del texto
+    grouped = table.group_by("type", use_threads=False).aggregate(
+        [("length", "count"), ("length", "sum")]
+    )
+    names = grouped["type"].to_pylist()
+    counts = dict(zip(names, grouped["length_count"].to_pylist()))
+    length_sums = dict(zip(names, grouped["length_sum"].to_pylist()))
+
+    # Histograma de strands; solo cuentan "+" y "-"
+    hist = pc.value_counts(table["strand"]).to_pylist()
+    seen = {row["values"]: row["counts"] for row in hist}
+    strand_counts = {}
+    if seen.get(_PLUS):
+        strand_counts["+"] = seen[_PLUS]
+    if seen.get(_MINUS):
+        strand_counts["-"] = seen[_MINUS]
+
+    return counts, length_sums, strand_counts
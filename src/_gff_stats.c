@@ -0,0 +1,729 @@
+/*
+ * _gff_stats.c - Núcleo en C para gff_stats.py
+ *
+ * Implementa el recorrido línea a línea de un archivo GFF sin crear objetos
+ * Python por línea: el archivo se lee en bloques grandes con fread(), las
+ * líneas se localizan con memchr(), las columnas con find_tabs() (SIMD) y
+ * start/end se convierten a entero con un bucle ASCII propio. Los acumuladores viven en una tabla C
+ * (un registro por tipo de feature) y solo al final se construyen los dict.
+ *
+ * Expone:
+ *     compute(path, filter_type=None) -> (counts, length_sums, strand_counts)
+ *     Scanner(filter_type=None): feed(bloque) incremental y result() con la
+ *         misma tupla; pensado para recorrer rangos del archivo en varios hilos
+ *
+ * Ambos recorren los bytes con el GIL liberado.
+ *
+ * Los tres dict tienen el mismo significado que los de _scan_gff() en
+ * gff_stats.py, de modo que el resultado final es idéntico.
+ *
+ * Compilación (desde la raíz del repositorio), con setup.py:
+ *     python setup.py build_ext --inplace      (deja el módulo en src/)
+ * o con `pip install .`. A mano:
+ *     cc -O3 -shared -fPIC $(python3-config --includes) src/_gff_stats.c \
+ *        -o src/_gff_stats$(python3-config --extension-suffix)
+ *
+ * Los tests de paridad se omiten si el módulo no está compilado; con
+ * GFF_STATS_REQUIRE_C=1 (p. ej. en CI) fallan en su lugar.
+ *
+ * Las tabulaciones de cada línea se buscan con SSE2 (16 bytes por
+ * comparación, siempre disponible en x86-64); añadiendo -mavx2 (o
+ * -march=native) se usan bloques de 32 bytes con AVX2. En otras
+ * arquitecturas se usa memchr().
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#if defined(__AVX2__) || defined(__SSE2__)
+#include <immintrin.h>
+#endif
+
+/* Tamaño del bloque de lectura (4 MB) */
+#define BUFFER_SIZE (4 * 1024 * 1024)
+
+/* Número de tabulaciones que necesitamos localizar (9 columnas = 8 tabs) */
+#define NUM_TABS 8
+
+/* Acumuladores de un tipo de feature */
+typedef struct {
+    char *name;            /* bytes del tipo (no terminados en NUL) */
+    Py_ssize_t len;        /* longitud del nombre */
+    long long count;       /* número de features de este tipo */
+    long long length_sum;  /* suma de longitudes (end - start + 1) */
+} TypeStat;
+
+/* Estado completo del recorrido */
+typedef struct {
+    TypeStat *types;       /* tabla de tipos en orden de aparición */
+    Py_ssize_t n_types;
+    Py_ssize_t cap_types;
+    long long plus;        /* features con strand "+" */
+    long long minus;       /* features con strand "-" */
+    const char *filter;    /* filtro por tipo (NULL = sin filtro) */
+    Py_ssize_t filter_len;
+} Stats;
+
+static int
+is_space(char c)
+{
+    return c == ' ' || c == '\t' || c == '\r' || c == '\n' || c == '\v' || c == '\f';
+}
+
+/*
+ * Máximo de cifras significativas de start/end (|v| < 10^18): siempre cabe en
+ * un long long. Es la misma cota que _INT_LIMIT en gff_stats.py y que
+ * _MAX_DIGITS en _scan.py, así todos los motores descartan las mismas líneas
+ */
+#define MAX_DIGITS 18
+
+/*
+ * Convierte los n bytes de p a entero, aceptando lo mismo que int() de Python
+ * en los casos habituales de un GFF: espacios alrededor, signo opcional y "_"
+ * entre dígitos. El camino común (solo dígitos) es un bucle v = v*10 + d sin
+ * ramas extra. Devuelve -1 si el campo no es un número o tiene más de 18
+ * cifras significativas (los ceros a la izquierda no cuentan, como en int()),
+ * en cuyo caso la línea se ignora, igual que en la versión en Python.
+ */
+static inline int
+parse_int(const char *p, Py_ssize_t n, long long *out)
+{
+    const char *end = p + n;
+    long long v = 0;
+    int negative = 0, digits = 0, significant = 0;
+
+    while (p < end && is_space(*p)) {
+        p++;
+    }
+    while (end > p && is_space(end[-1])) {
+        end--;
+    }
+    if (p < end && (*p == '+' || *p == '-')) {
+        negative = (*p == '-');
+        p++;
+    }
+    if (p == end) {
+        return -1;
+    }
+
+    for (; p < end; p++) {
+        unsigned int d = (unsigned char)*p - '0';
+        if (d > 9) {
+            /* "_" solo se admite entre dos dígitos */
+            if (*p == '_' && digits > 0 && p + 1 < end
+                && (unsigned char)p[1] - '0' <= 9) {
+                continue;
+            }
+            return -1;
+        }
+        digits++;
+        if ((v != 0 || d != 0) && ++significant > MAX_DIGITS) {
+            return -1;
+        }
+        v = v * 10 + d;
+    }
+
+    *out = negative ? -v : v;
+    return 0;
+}
+
+/* Busca (o crea) el registro del tipo [name, name + len). NULL si no hay memoria. */
+static TypeStat *
+get_type(Stats *st, const char *name, Py_ssize_t len)
+{
+    Py_ssize_t i;
+    TypeStat *t;
+
+    /* El vocabulario de tipos GFF es pequeño: búsqueda lineal */
+    for (i = 0; i < st->n_types; i++) {
+        t = &st->types[i];
+        if (t->len == len && memcmp(t->name, name, (size_t)len) == 0) {
+            return t;
+        }
+    }
+
+    if (st->n_types == st->cap_types) {
+        Py_ssize_t cap = st->cap_types ? st->cap_types * 2 : 16;
+        TypeStat *types = realloc(st->types, (size_t)cap * sizeof(TypeStat));
+        if (types == NULL) {
+            return NULL;
+        }
+        st->types = types;
+        st->cap_types = cap;
+    }
+
+    t = &st->types[st->n_types];
+    t->name = malloc(len ? (size_t)len : 1);
+    if (t->name == NULL) {
+        return NULL;
+    }
+    memcpy(t->name, name, (size_t)len);
+    t->len = len;
+    t->count = 0;
+    t->length_sum = 0;
+    st->n_types++;
+    return t;
+}
+
+/*
+ * Guarda en tabs[] la posición de las primeras `max` tabulaciones de
+ * [p, end) y devuelve cuántas encontró.
+ *
+ * Con SIMD se compara un bloque entero contra '\t' y la máscara de bits
+ * resultante (un bit por byte) se recorre con __builtin_ctz, de modo que
+ * todas las tabulaciones de un bloque salen de una sola comparación. La
+ * cola de menos de un bloque se recorre byte a byte.
+ */
+static inline int
+find_tabs(const char *p, const char *end, const char **tabs, int max)
+{
+    int k = 0;
+
+#if defined(__AVX2__)
+    const __m256i tab32 = _mm256_set1_epi8('\t');
+    while (end - p >= 32) {
+        __m256i chunk = _mm256_loadu_si256((const __m256i *)p);
+        unsigned int mask =
+            (unsigned int)_mm256_movemask_epi8(_mm256_cmpeq_epi8(chunk, tab32));
+        while (mask != 0) {
+            tabs[k++] = p + __builtin_ctz(mask);
+            if (k == max) {
+                return k;
+            }
+            mask &= mask - 1;
+        }
+        p += 32;
+    }
+#endif
+#if defined(__SSE2__)
+    const __m128i tab16 = _mm_set1_epi8('\t');
+    while (end - p >= 16) {
+        __m128i chunk = _mm_loadu_si128((const __m128i *)p);
+        unsigned int mask =
+            (unsigned int)_mm_movemask_epi8(_mm_cmpeq_epi8(chunk, tab16));
+        while (mask != 0) {
+            tabs[k++] = p + __builtin_ctz(mask);
+            if (k == max) {
+                return k;
+            }
+            mask &= mask - 1;
+        }
+        p += 16;
+    }
+    for (; p < end; p++) {
+        if (*p == '\t') {
+            tabs[k++] = p;
+            if (k == max) {
+                break;
+            }
+        }
+    }
+#else
+    /* Sin SIMD: memchr() de la libc */
+    while (k < max && (p = memchr(p, '\t', (size_t)(end - p))) != NULL) {
+        tabs[k++] = p++;
+    }
+#endif
+    return k;
+}
+
+
+/*
+ * Procesa una línea [line, end) sin el '\n' final.
+ * Devuelve 0 si todo fue bien (aunque la línea se haya ignorado) y -1 si
+ * falta memoria.
+ */
+static int
+process_line(Stats *st, const char *line, const char *end)
+{
+    const char *tabs[NUM_TABS];
+    const char *type_start, *strand;
+    long long start, stop;
+    TypeStat *t;
+
+    /* Equivalente a line.strip() */
+    while (line < end && is_space(*line)) {
+        line++;
+    }
+    while (end > line && is_space(end[-1])) {
+        end--;
+    }
+
+    /* Saltar líneas vacías y comentarios */
+    if (line == end || line[0] == '#') {
+        return 0;
+    }
+
+    /* Localizar las 8 tabulaciones; con menos de 9 columnas se ignora la línea */
+    if (find_tabs(line, end, tabs, NUM_TABS) < NUM_TABS) {
+        return 0;
+    }
+
+    /* Columna 2: tipo de feature, con filtro opcional */
+    type_start = tabs[1] + 1;
+    if (st->filter != NULL
+        && (tabs[2] - type_start != st->filter_len
+            || memcmp(type_start, st->filter, (size_t)st->filter_len) != 0)) {
+        return 0;
+    }
+
+    /* Columnas 3 y 4: start y end */
+    if (parse_int(tabs[2] + 1, tabs[3] - tabs[2] - 1, &start) < 0
+        || parse_int(tabs[3] + 1, tabs[4] - tabs[3] - 1, &stop) < 0) {
+        return 0;
+    }
+
+    t = get_type(st, type_start, tabs[2] - type_start);
+    if (t == NULL) {
+        return -1;
+    }
+    t->count++;
+    t->length_sum += stop - start + 1;
+
+    /* Columna 6: strand (solo cuentan "+" y "-") */
+    strand = tabs[5] + 1;
+    if (tabs[6] - strand == 1) {
+        if (*strand == '+') {
+            st->plus++;
+        }
+        else if (*strand == '-') {
+            st->minus++;
+        }
+    }
+    return 0;
+}
+
+/* Códigos de error internos (se convierten en excepción con el GIL tomado) */
+#define SCAN_OK 0
+#define SCAN_NOMEM -1
+#define SCAN_IOERROR -2
+
+/*
+ * Lee el archivo completo por bloques. No usa la API de Python, de modo que
+ * puede ejecutarse sin el GIL. Devuelve SCAN_OK, SCAN_NOMEM o SCAN_IOERROR
+ * (con errno puesto).
+ */
+static int
+scan_file(Stats *st, const char *path)
+{
+    FILE *fh;
+    char *buf, *nl, *line;
+    size_t cap = BUFFER_SIZE, filled = 0, n;
+    int status = SCAN_OK;
+
+    fh = fopen(path, "rb");
+    if (fh == NULL) {
+        return SCAN_IOERROR;
+    }
+    buf = malloc(cap);
+    if (buf == NULL) {
+        fclose(fh);
+        return SCAN_NOMEM;
+    }
+
+    for (;;) {
+        n = fread(buf + filled, 1, cap - filled, fh);
+        if (n == 0) {
+            break;
+        }
+        filled += n;
+
+        /* Procesar todas las líneas completas del bloque */
+        line = buf;
+        while ((nl = memchr(line, '\n', (size_t)(buf + filled - line))) != NULL) {
+            if (process_line(st, line, nl) < 0) {
+                status = SCAN_NOMEM;
+                goto done;
+            }
+            line = nl + 1;
+        }
+
+        /* Mover la línea incompleta al inicio; si ocupa todo el buffer, crecer */
+        filled = (size_t)(buf + filled - line);
+        memmove(buf, line, filled);
+        if (filled == cap) {
+            char *bigger = realloc(buf, cap * 2);
+            if (bigger == NULL) {
+                status = SCAN_NOMEM;
+                goto done;
+            }
+            buf = bigger;
+            cap *= 2;
+        }
+    }
+
+    if (ferror(fh)) {
+        status = SCAN_IOERROR;
+        goto done;
+    }
+
+    /* Última línea sin '\n' final */
+    if (filled > 0 && process_line(st, buf, buf + filled) < 0) {
+        status = SCAN_NOMEM;
+    }
+
+done:
+    free(buf);
+    fclose(fh);
+    return status;
+}
+
+/* Añade dict[key] = value (entero). Devuelve -1 si falla. */
+static int
+set_count(PyObject *dict, PyObject *key, long long value)
+{
+    PyObject *v = PyLong_FromLongLong(value);
+    int rc;
+    if (v == NULL) {
+        return -1;
+    }
+    rc = PyDict_SetItem(dict, key, v);
+    Py_DECREF(v);
+    return rc;
+}
+
+/* Construye (counts, length_sums, strand_counts) a partir de la tabla C */
+static PyObject *
+build_result(Stats *st)
+{
+    PyObject *counts = PyDict_New();
+    PyObject *length_sums = PyDict_New();
+    PyObject *strand_counts = PyDict_New();
+    PyObject *key = NULL;
+    Py_ssize_t i;
+
+    if (counts == NULL || length_sums == NULL || strand_counts == NULL) {
+        goto error;
+    }
+
+    for (i = 0; i < st->n_types; i++) {
+        TypeStat *t = &st->types[i];
+        key = PyUnicode_DecodeUTF8(t->name, t->len, NULL);
+        if (key == NULL
+            || set_count(counts, key, t->count) < 0
+            || set_count(length_sums, key, t->length_sum) < 0) {
+            goto error;
+        }
+        Py_CLEAR(key);
+    }
+
+    /* Igual que la versión en Python: solo aparecen los strands vistos */
+    if (st->plus) {
+        key = PyUnicode_FromString("+");
+        if (key == NULL || set_count(strand_counts, key, st->plus) < 0) {
+            goto error;
+        }
+        Py_CLEAR(key);
+    }
+    if (st->minus) {
+        key = PyUnicode_FromString("-");
+        if (key == NULL || set_count(strand_counts, key, st->minus) < 0) {
+            goto error;
+        }
+        Py_CLEAR(key);
+    }
+
+    return Py_BuildValue("(NNN)", counts, length_sums, strand_counts);
+
+error:
+    Py_XDECREF(key);
+    Py_XDECREF(counts);
+    Py_XDECREF(length_sums);
+    Py_XDECREF(strand_counts);
+    return NULL;
+}
+
+static void
+free_stats(Stats *st)
+{
+    Py_ssize_t i;
+    for (i = 0; i < st->n_types; i++) {
+        free(st->types[i].name);
+    }
+    free(st->types);
+}
+
+static PyObject *
+gff_compute(PyObject *self, PyObject *args)
+{
+    PyObject *path_bytes = NULL;
+    PyObject *result = NULL;
+    const char *filter = NULL;
+    Py_ssize_t filter_len = 0;
+    Stats st;
+    int status;
+
+    (void)self;
+    if (!PyArg_ParseTuple(args, "O&|z#:compute", PyUnicode_FSConverter, &path_bytes,
+                          &filter, &filter_len)) {
+        return NULL;
+    }
+
+    memset(&st, 0, sizeof(st));
+    /* Un filtro vacío equivale a no filtrar (igual que `if filter_type`) */
+    if (filter != NULL && filter_len > 0) {
+        st.filter = filter;
+        st.filter_len = filter_len;
+    }
+
+    /* El recorrido no toca objetos Python: liberar el GIL mientras dura */
+    Py_BEGIN_ALLOW_THREADS
+    status = scan_file(&st, PyBytes_AS_STRING(path_bytes));
+    Py_END_ALLOW_THREADS
+
+    if (status == SCAN_OK) {
+        result = build_result(&st);
+    }
+    else if (status == SCAN_IOERROR) {
+        PyErr_SetFromErrnoWithFilename(PyExc_OSError, PyBytes_AS_STRING(path_bytes));
+    }
+    else {
+        PyErr_NoMemory();
+    }
+
+    free_stats(&st);
+    Py_DECREF(path_bytes);
+    return result;
+}
+
+/*
+ * Scanner: recorrido incremental sobre bloques de bytes.
+ *
+ * feed() recibe cualquier objeto con protocolo buffer (bytes, bytearray,
+ * memoryview...) y lo recorre en su sitio (PyBUF_SIMPLE, sin copiarlo) con el
+ * GIL liberado; solo la línea incompleta del final se copia para unirla al
+ * bloque siguiente. Cada hilo debe usar su propio Scanner: mientras un feed()
+ * recorre su bloque sin el GIL, el objeto queda marcado como ocupado y
+ * cualquier otra llamada a feed(), result() o __init__() lanza RuntimeError
+ * en lugar de modificar la tabla o la línea pendiente a la vez.
+ */
+typedef struct {
+    PyObject_HEAD
+    Stats st;
+    char *filter;          /* copia propia del filtro (NULL = sin filtro) */
+    char *tail;            /* línea incompleta pendiente del bloque anterior */
+    size_t tail_len;
+    size_t tail_cap;
+    int busy;              /* 1 mientras un feed() recorre un bloque sin el GIL */
+} ScannerObject;
+
+/* Lanza RuntimeError si otro hilo está dentro de feed(). Se llama con el GIL. */
+static int
+scanner_check_busy(ScannerObject *self)
+{
+    if (self->busy) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "Scanner is being fed from another thread; "
+                        "use one Scanner per thread");
+        return -1;
+    }
+    return 0;
+}
+
+/* Añade [p, p + n) a la línea pendiente. Devuelve -1 si no hay memoria. */
+static int
+append_tail(ScannerObject *self, const char *p, size_t n)
+{
+    if (self->tail_len + n > self->tail_cap) {
+        size_t cap = self->tail_cap ? self->tail_cap : 256;
+        char *tail;
+        while (cap < self->tail_len + n) {
+            cap *= 2;
+        }
+        tail = realloc(self->tail, cap);
+        if (tail == NULL) {
+            return -1;
+        }
+        self->tail = tail;
+        self->tail_cap = cap;
+    }
+    memcpy(self->tail + self->tail_len, p, n);
+    self->tail_len += n;
+    return 0;
+}
+
+/* Recorre un bloque sin usar la API de Python. Devuelve SCAN_OK o SCAN_NOMEM. */
+static int
+scanner_feed_block(ScannerObject *self, const char *data, size_t n)
+{
+    const char *p = data, *end = data + n, *nl;
+
+    /* Completar la línea pendiente con el inicio de este bloque */
+    if (self->tail_len > 0) {
+        nl = memchr(p, '\n', n);
+        if (nl == NULL) {
+            return append_tail(self, p, n) < 0 ? SCAN_NOMEM : SCAN_OK;
+        }
+        if (append_tail(self, p, (size_t)(nl - p)) < 0
+            || process_line(&self->st, self->tail, self->tail + self->tail_len) < 0) {
+            return SCAN_NOMEM;
+        }
+        self->tail_len = 0;
+        p = nl + 1;
+    }
+
+    /* Líneas completas: se recorren directamente sobre el buffer recibido */
+    while ((nl = memchr(p, '\n', (size_t)(end - p))) != NULL) {
+        if (process_line(&self->st, p, nl) < 0) {
+            return SCAN_NOMEM;
+        }
+        p = nl + 1;
+    }
+
+    /* Guardar la línea incompleta del final */
+    if (p < end && append_tail(self, p, (size_t)(end - p)) < 0) {
+        return SCAN_NOMEM;
+    }
+    return SCAN_OK;
+}
+
+static int
+scanner_init(ScannerObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"filter_type", NULL};
+    const char *filter = NULL;
+    Py_ssize_t filter_len = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|z#:Scanner", kwlist, &filter, &filter_len)
+        || scanner_check_busy(self) < 0) {
+        return -1;
+    }
+
+    /* __init__ puede volver a llamarse sobre el mismo objeto: descartar la
+     * tabla, el filtro y la línea pendiente anteriores */
+    free_stats(&self->st);
+    memset(&self->st, 0, sizeof(self->st));
+    free(self->filter);
+    self->filter = NULL;
+    self->tail_len = 0;
+
+    /* Un filtro vacío equivale a no filtrar (igual que `if filter_type`) */
+    if (filter != NULL && filter_len > 0) {
+        self->filter = malloc((size_t)filter_len);
+        if (self->filter == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        memcpy(self->filter, filter, (size_t)filter_len);
+        self->st.filter = self->filter;
+        self->st.filter_len = filter_len;
+    }
+    return 0;
+}
+
+static void
+scanner_dealloc(ScannerObject *self)
+{
+    free_stats(&self->st);
+    free(self->filter);
+    free(self->tail);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+scanner_feed(ScannerObject *self, PyObject *data)
+{
+    Py_buffer view;
+    int status;
+
+    if (scanner_check_busy(self) < 0
+        || PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+
+    /* busy se marca y se limpia con el GIL tomado: ningún otro hilo puede
+     * entrar en feed()/result() entre la comprobación y la marca */
+    self->busy = 1;
+    Py_BEGIN_ALLOW_THREADS
+    status = scanner_feed_block(self, view.buf, (size_t)view.len);
+    Py_END_ALLOW_THREADS
+    self->busy = 0;
+
+    PyBuffer_Release(&view);
+    if (status != SCAN_OK) {
+        return PyErr_NoMemory();
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+scanner_result(ScannerObject *self, PyObject *Py_UNUSED(ignored))
+{
+    if (scanner_check_busy(self) < 0) {
+        return NULL;
+    }
+
+    /* Procesar la última línea (sin '\n' final) antes de construir el resultado */
+    if (self->tail_len > 0) {
+        if (process_line(&self->st, self->tail, self->tail + self->tail_len) < 0) {
+            return PyErr_NoMemory();
+        }
+        self->tail_len = 0;
+    }
+    return build_result(&self->st);
+}
+
+static PyMethodDef scanner_methods[] = {
+    {"feed", (PyCFunction)scanner_feed, METH_O,
+     "feed(data)\n\nRecorre un bloque de bytes (sin copiarlo y sin el GIL)."},
+    {"result", (PyCFunction)scanner_result, METH_NOARGS,
+     "result() -> (counts, length_sums, strand_counts)\n\n"
+     "Procesa la línea pendiente y devuelve los contadores acumulados."},
+    {NULL, NULL, 0, NULL}
+};
+
+static PyTypeObject ScannerType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "_gff_stats.Scanner",
+    .tp_basicsize = sizeof(ScannerObject),
+    .tp_dealloc = (destructor)scanner_dealloc,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "Scanner(filter_type=None)\n\n"
+              "Recorrido incremental de un GFF: feed(bloque) varias veces y result().",
+    .tp_methods = scanner_methods,
+    .tp_init = (initproc)scanner_init,
+    .tp_new = PyType_GenericNew,
+};
+
+static PyMethodDef gff_methods[] = {
+    {"compute", gff_compute, METH_VARARGS,
+     "compute(path, filter_type=None) -> (counts, length_sums, strand_counts)\n\n"
+     "Recorre el archivo GFF y devuelve los contadores crudos por tipo y strand."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef gff_module = {
+    PyModuleDef_HEAD_INIT,
+    "_gff_stats",
+    "Núcleo en C para el análisis de archivos GFF (ver gff_stats.py).",
+    -1,
+    gff_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit__gff_stats(void)
+{
+    PyObject *module;
+
+    if (PyType_Ready(&ScannerType) < 0) {
+        return NULL;
+    }
+    module = PyModule_Create(&gff_module);
+    if (module == NULL) {
+        return NULL;
+    }
+    Py_INCREF(&ScannerType);
+    if (PyModule_AddObject(module, "Scanner", (PyObject *)&ScannerType) < 0) {
+        Py_DECREF(&ScannerType);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
@@ -0,0 +1,310 @@
+"""Escáner GFF compilado con Numba
+
+Recorre el archivo GFF como un arreglo de bytes (np.frombuffer sobre un mmap)
+dentro de una función @njit, de modo que el bucle por línea se ejecuta como
+código nativo y no crea ningún objeto Python por registro.
+
+El escáner produce columnas paralelas (estructura de arreglos): id de tipo,
+start, end y strand de cada registro, y la agregación se hace sobre esas
+columnas (bincount de NumPy para conteos y strands, y sumas de longitudes en
+int64 compiladas). gff_stats.py importa
+este módulo de forma opcional: si numpy o numba no están instalados, se usa
+otro motor.
+
+Expone:
+    parse_to_arrays(path, filter_type=None) -> dict con las columnas
+    compute(path, filter_type=None) -> (counts, length_sums, strand_counts)
+"""
+from __future__ import annotations
+
+import mmap
+import os
+from typing import Dict, Tuple
+
+import numpy as np
+from numba import njit
+
+# Bytes ASCII relevantes para el recorrido
+_TAB = 9  # "\t"
+_NEWLINE = 10  # "\n"
+_HASH = 35  # "#"
+_PLUS = 43  # "+"
+_MINUS = 45  # "-"
+_ZERO = 48  # "0"
+_NINE = 57  # "9"
+_UNDERSCORE = 95  # "_"
+
+# Máximo de cifras significativas de start/end (|v| < 10**18, cabe en int64);
+# la misma cota que MAX_DIGITS en _gff_stats.c y _INT_LIMIT en gff_stats.py
+_MAX_DIGITS = 18
+
+
+@njit(cache=True)
+def _is_space(b):
+    """Espacio en blanco ASCII, igual que bytes.strip()."""
+    return b == 32 or (b >= 9 and b <= 13)
+
+
+@njit(cache=True)
+def _parse_int(buf, start, end):
+    """Convierte buf[start:end] a entero. Devuelve (valor, ok).
+
+    Acepta lo mismo que int() en los casos habituales de un GFF (y que
+    parse_int() en _gff_stats.c): espacios alrededor, signo opcional y "_"
+    entre dígitos, con un máximo de 18 cifras significativas (los ceros a la
+    izquierda no cuentan).
+    """
+    while start < end and _is_space(buf[start]):
+        start += 1
+    while end > start and _is_space(buf[end - 1]):
+        end -= 1
+    negative = False
+    if start < end and (buf[start] == _PLUS or buf[start] == _MINUS):
+        negative = buf[start] == _MINUS
+        start += 1
+    if start == end:
+        return 0, False
+
+    value = 0
+    digits = 0
+    significant = 0
+    for i in range(start, end):
+        b = buf[i]
+        if b < _ZERO or b > _NINE:
+            # "_" solo se admite entre dos dígitos
+            if (b == _UNDERSCORE and digits > 0 and i + 1 < end
+                    and buf[i + 1] >= _ZERO and buf[i + 1] <= _NINE):
+                continue
+            return 0, False
+        digits += 1
+        if value != 0 or b != _ZERO:
+            significant += 1
+            if significant > _MAX_DIGITS:
+                return 0, False
+        value = value * 10 + (b - _ZERO)
+    if negative:
+        value = -value
+    return value, True
+
+
+@njit(cache=True)
+def _count_lines(buf):
+    """Cota superior del número de registros: número de saltos de línea + 1.
+
+    Recorre buf dentro de la función compilada, sin crear un arreglo booleano
+    temporal del tamaño del archivo (buf == _NEWLINE duplicaría la memoria).
+    """
+    n = 1
+    for i in range(buf.size):
+        if buf[i] == _NEWLINE:
+            n += 1
+    return n
+
+
+@njit(cache=True)
+def _sum_by_type(type_id, start, end, n_types):
+    """Suma end - start + 1 por id de tipo en int64 (exacto, sin pasar por float)."""
+    sums = np.zeros(n_types, np.int64)
+    for i in range(type_id.size):
+        sums[type_id[i]] += end[i] - start[i] + 1
+    return sums
+
+
+@njit(cache=True)
+def scan(buf, filter_type, cap):
+    """Recorre buf (uint8) y devuelve los registros como arreglos paralelos.
+
+    Args:
+        buf: contenido completo del archivo GFF como arreglo uint8
+        filter_type: bytes del tipo a conservar como uint8 (vacío = sin filtro)
+        cap: cota superior del número de registros (número de líneas)
+
+    Returns:
+        (type_out, start_out, end_out, strand_out, type_starts, type_lens):
+            - type_out: id de tipo de cada registro (int32)
+            - start_out / end_out: posiciones start y end (int64)
+            - strand_out: byte del strand ("+", "-", ...) o 0 si no es de 1 byte
+            - type_starts / type_lens: posición en buf del nombre de cada id
+    """
+    size = buf.size
+    type_out = np.empty(cap, np.int32)
+    start_out = np.empty(cap, np.int64)
+    end_out = np.empty(cap, np.int64)
+    strand_out = np.empty(cap, np.uint8)
+
+    # Tabla de tipos: cada id apunta a su primera aparición dentro de buf
+    type_starts = np.empty(64, np.int64)
+    type_lens = np.empty(64, np.int64)
+    n_types = 0
+
+    tabs = np.empty(8, np.int64)
+    filter_len = filter_type.size
+    n = 0
+    pos = 0
+    while pos < size:
+        # Localizar el final de la línea
+        end = pos
+        while end < size and buf[end] != _NEWLINE:
+            end += 1
+
+        # Equivalente a line.strip(): recortar espacios en blanco (incluido el
+        # \r de CRLF y un tab final con atributos vacíos) por ambos extremos
+        line_start = pos
+        line_end = end
+        while line_start < line_end and _is_space(buf[line_start]):
+            line_start += 1
+        while line_end > line_start and _is_space(buf[line_end - 1]):
+            line_end -= 1
+
+        # Saltar líneas vacías y comentarios (aunque tengan sangría)
+        if line_end > line_start and buf[line_start] != _HASH:
+            # Localizar las 8 tabulaciones (9 columnas)
+            k = 0
+            i = line_start
+            while i < line_end and k < 8:
+                if buf[i] == _TAB:
+                    tabs[k] = i
+                    k += 1
+                i += 1
+
+            if k == 8:
+                # Columna 2: tipo de feature, con filtro opcional
+                t_start = tabs[1] + 1
+                t_len = tabs[2] - t_start
+                keep = True
+                if filter_len > 0:
+                    if t_len != filter_len:
+                        keep = False
+                    else:
+                        for j in range(t_len):
+                            if buf[t_start + j] != filter_type[j]:
+                                keep = False
+                                break
+
+                # Columnas 3 y 4: start y end
+                if keep:
+                    start, ok_start = _parse_int(buf, tabs[2] + 1, tabs[3])
+                    stop, ok_stop = _parse_int(buf, tabs[3] + 1, tabs[4])
+                    keep = ok_start and ok_stop
+
+                if keep:
+                    # Buscar el id del tipo (vocabulario pequeño: búsqueda lineal)
+                    tid = -1
+                    for t in range(n_types):
+                        if type_lens[t] == t_len:
+                            same = True
+                            for j in range(t_len):
+                                if buf[type_starts[t] + j] != buf[t_start + j]:
+                                    same = False
+                                    break
+                            if same:
+                                tid = t
+                                break
+                    if tid < 0:
+                        if n_types == type_starts.size:
+                            type_starts = np.concatenate((type_starts, np.empty(n_types, np.int64)))
+                            type_lens = np.concatenate((type_lens, np.empty(n_types, np.int64)))
+                        tid = n_types
+                        type_starts[tid] = t_start
+                        type_lens[tid] = t_len
+                        n_types += 1
+
+                    type_out[n] = tid
+                    start_out[n] = start
+                    end_out[n] = stop
+
+                    # Columna 6: strand de un solo byte
+                    if tabs[6] - tabs[5] == 2:
+                        strand_out[n] = buf[tabs[5] + 1]
+                    else:
+                        strand_out[n] = 0
+                    n += 1
+
+        pos = end + 1
+
+    return (
+        type_out[:n],
+        start_out[:n],
+        end_out[:n],
+        strand_out[:n],
+        type_starts[:n_types],
+        type_lens[:n_types],
+    )
+
+
+def parse_to_arrays(path: str, filter_type: str | None = None) -> Dict:
+    """Lee el archivo GFF y devuelve sus registros como columnas NumPy.
+
+    Returns:
+        Dict: {"type_id", "start", "end", "strand"} (arreglos de igual longitud,
+        uno por registro) y "type_names" (lista: nombre de cada id de tipo)
+    """
+    with open(path, "rb") as fh:
+        # mmap no admite archivos vacíos: devolver columnas vacías
+        if os.fstat(fh.fileno()).st_size == 0:
+            return {
+                "type_id": np.empty(0, np.int32),
+                "start": np.empty(0, np.int64),
+                "end": np.empty(0, np.int64),
+                "strand": np.empty(0, np.uint8),
+                "type_names": [],
+            }
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            if filter_type:
+                filter_arr = np.frombuffer(filter_type.encode("utf-8"), dtype=np.uint8)
+            else:
+                filter_arr = np.empty(0, dtype=np.uint8)
+
+            # Cota superior de registros (número de líneas), contada en código
+            # compilado sin arreglos temporales
+            cap = _count_lines(buf)
+            type_id, start, end, strand, type_starts, type_lens = scan(buf, filter_arr, cap)
+            names = [
+                bytes(buf[s:s + n]).decode("utf-8")
+                for s, n in zip(type_starts.tolist(), type_lens.tolist())
+            ]
+            # Liberar la vista antes de cerrar el mmap
+            del buf
+
+    return {
+        "type_id": type_id,
+        "start": start,
+        "end": end,
+        "strand": strand,
+        "type_names": names,
+    }
+
+
+def compute(path: str, filter_type: str | None = None) -> Tuple[Dict, Dict, Dict]:
+    """Analiza el archivo GFF con el escáner compilado.
+
+    Devuelve (counts, length_sums, strand_counts) con el mismo formato que
+    _scan_gff() en gff_stats.py.
+    """
+    cols = parse_to_arrays(path, filter_type)
+    type_id = cols["type_id"]
+    names = cols["type_names"]
+
+    # Agregación por id de tipo sobre las columnas. Las sumas de longitudes se
+    # acumulan en int64 dentro de código compilado: bincount(weights=...)
+    # trabaja en float64 y pierde exactitud por encima de 2**53
+    counts_arr = np.bincount(type_id, minlength=len(names))
+    sums_arr = _sum_by_type(type_id, cols["start"], cols["end"], len(names))
+
+    counts = {name: int(counts_arr[i]) for i, name in enumerate(names)}
+    length_sums = {name: int(sums_arr[i]) for i, name in enumerate(names)}
+
+    # Histograma de strands en una sola reducción (1 byte por registro);
+    # solo cuentan "+" y "-"
+    strand_hist = np.bincount(cols["strand"], minlength=128)
+    strand_counts = {}
+    plus = int(strand_hist[_PLUS])
+    minus = int(strand_hist[_MINUS])
+    if plus:
+        strand_counts["+"] = plus
+    if minus:
+        strand_counts["-"] = minus
+
+    return counts, length_sums, strand_counts
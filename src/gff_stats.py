@@ -23,12 +23,365 @@ Ejemplo:
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import importlib
 import json
-from collections import defaultdict
-from typing import Dict, Tuple
+import os
+import warnings
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Tuple
 
+# API pública del módulo
+__all__ = ("compute_stats_from_gff", "cli")
 
-def compute_stats_from_gff(path: str, filter_type: str | None = None) -> Dict:
+try:
+    # Serializador JSON opcional escrito en C (más rápido que json.dump con indent)
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Núcleo opcional en C (ver _gff_stats.c); si no está compilado se usa Python puro
+    import _gff_stats
+except ImportError:
+    _gff_stats = None
+
+try:
+    # Lectura opcional con io_uring (ver _uring_reader.py; requiere liburing)
+    import _uring_reader
+except ImportError:
+    _uring_reader = None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_optional(name: str):
+    """Importa un módulo opcional la primera vez que se necesita (None si falta).
+
+    Para los módulos que arrastran dependencias pesadas: _scan (numpy y numba,
+    ~400 ms de importación) y _arrow_cache (pyarrow). Así `import gff_stats`
+    no las carga cuando se va a usar el núcleo en C o no se pide --cache.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# Tamaño del buffer de lectura del archivo GFF (4 MB)
+_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Cota de start/end: como en los motores en C y Numba, se admiten a lo sumo 18
+# cifras significativas (|v| < 10**18), de modo que cada valor cabe en los
+# acumuladores int64; las líneas con valores mayores se ignoran
+_INT_LIMIT = 10 ** 18
+
+# Tamaño mínimo de archivo para repartir el trabajo entre procesos o hilos
+# (64 MB); por debajo, coordinar los trabajadores cuesta más de lo que se gana
+_PARALLEL_MIN_SIZE = 64 * 1024 * 1024
+
+
+def _lines_from_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Convierte una secuencia de bloques de bytes en líneas (sin el \\n final).
+
+    La última línea de cada bloque puede estar incompleta: se guarda y se
+    antepone al bloque siguiente.
+    """
+    tail = b""
+    for chunk in chunks:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def _scan_lines(lines: Iterable[bytes], filter_type: str | None = None) -> Tuple[Dict, Dict, Dict]:
+    """Recorre líneas GFF en bytes y acumula los contadores crudos.
+
+    Es el bucle en Python puro que usan _scan_gff() y _scan_chunk(). Las líneas
+    pueden traer o no el \\n final. Devuelve una tupla (counts, length_sums,
+    strand_counts) con los mismos significados que usa compute_stats_from_gff().
+    """
+    # Cada tipo de feature recibe un id entero (0, 1, 2...) la primera vez que
+    # aparece; los acumuladores son arreglos de enteros indexados por ese id.
+    # Las claves son bytes: se decodifican a str una sola vez al final
+    type_ids = {}  # Id de cada tipo en orden de aparición: {b"gene": 0, b"CDS": 1, ...}
+    cnt_arr = array("q")  # Conteo de features por id de tipo
+    sum_arr = array("q")  # Suma acumulada de longitudes por id de tipo
+    strand_counts = {}  # Conteo de cada valor de strand: {b"+": N, b"-": M, b".": K, ...}
+
+    # Enlazar en variables locales los métodos usados en el bucle: evita resolver
+    # atributos (LOAD_ATTR / LOAD_GLOBAL) en cada línea
+    _int = int
+    _strip = bytes.strip
+    _split = bytes.split
+    _limit = _INT_LIMIT
+    type_ids_get = type_ids.get
+    strand_counts_get = strand_counts.get
+
+    # Dos bucles especializados, con y sin filtro: ninguno pregunta en cada
+    # línea si hay filtro. Solo cambia la validación de las columnas; el resto
+    # del cuerpo es idéntico en ambos
+    if filter_type:
+        # El filtro se compara contra bytes, sin decodificar cada línea
+        filter_bytes = filter_type.encode("utf-8")
+        for line in lines:
+            # Quitar espacios en blanco al inicio/final (incluye \n y \r\n), igual
+            # que el núcleo en C: una línea con la columna de atributos vacía
+            # (terminada en tab) queda con 8 columnas y se descarta abajo
+            line = _strip(line)
+            
+            # Saltar líneas vacías y líneas de comentario (aunque tengan sangría)
+            if not line or line[0] == 35:  # 35 = "#"
+                continue
+            
+            # Dividir por tabulaciones con maxsplit=8: las columnas 0-7 quedan
+            # separadas y cols[8] guarda los atributos sin partir
+            cols = _split(line, b"\t", 8)
+            
+            # Validar las 9 columnas y comparar el tipo (columna 2) antes de
+            # convertir start/end: las líneas de otros tipos se descartan aquí
+            if len(cols) < 9 or cols[2] != filter_bytes:
+                continue
+            
+            # Columnas 3 y 4: start y end
+            try:
+                start = _int(cols[3])
+                end = _int(cols[4])
+            except ValueError:
+                continue
+            if (start | end) >> 59 and not (-_limit < start < _limit and -_limit < end < _limit):
+                continue
+            
+            # Obtener el id del tipo (asignar uno nuevo si es la primera vez)
+            feature_type = cols[2]
+            tid = type_ids_get(feature_type)
+            if tid is None:
+                tid = type_ids[feature_type] = len(type_ids)
+                cnt_arr.append(0)
+                sum_arr.append(0)
+            
+            # Conteo, longitud (end - start + 1) y strand (columna 6)
+            cnt_arr[tid] += 1
+            sum_arr[tid] += end - start + 1
+            strand = cols[6]
+            strand_counts[strand] = strand_counts_get(strand, 0) + 1
+    else:
+        for line in lines:
+            # Quitar espacios en blanco al inicio/final (ver el bucle con filtro)
+            line = _strip(line)
+            
+            # Saltar líneas vacías y líneas de comentario (aunque tengan sangría)
+            if not line or line[0] == 35:  # 35 = "#"
+                continue
+            
+            # Dividir por tabulaciones con maxsplit=8: las columnas 0-7 quedan
+            # separadas y cols[8] guarda los atributos sin partir. Con
+            # maxsplit=7 habría que volver a recorrer cols[7] buscando el tab
+            # de los atributos, que es la columna más larga
+            cols = _split(line, b"\t", 8)
+            
+            # Validar que haya suficientes columnas (9 piezas)
+            if len(cols) < 9:
+                # Saltar líneas malformadas silenciosamente
+                continue
+            
+            # Columnas 3 y 4 (índices 3 y 4): start y end positions
+            try:
+                start = _int(cols[3])
+                end = _int(cols[4])
+            except ValueError:
+                # Saltar si start o end no son números válidos
+                continue
+            
+            # Saltar valores de más de 18 cifras (no caben en los arreglos
+            # int64 y los motores en C y Numba también los rechazan). El
+            # desplazamiento (start | end) >> 59 es 0 para las coordenadas
+            # habituales (positivas y < 2**59), así que la comparación exacta
+            # con la cota solo se hace con valores enormes o negativos
+            if (start | end) >> 59 and not (-_limit < start < _limit and -_limit < end < _limit):
+                continue
+            
+            # Obtener el id del tipo (columna 2; asignar uno nuevo si es la
+            # primera vez)
+            feature_type = cols[2]
+            tid = type_ids_get(feature_type)
+            if tid is None:
+                tid = type_ids[feature_type] = len(type_ids)
+                cnt_arr.append(0)
+                sum_arr.append(0)
+            
+            # Incrementar conteo para este tipo y acumular longitud (end - start
+            # + 1, ambos inclusive) para promedios
+            cnt_arr[tid] += 1
+            sum_arr[tid] += end - start + 1
+            
+            # Contar el strand (columna 6) sea cual sea su valor (sin preguntar
+            # si es + o -); al final solo se conservan "+" y "-"
+            strand = cols[6]
+            strand_counts[strand] = strand_counts_get(strand, 0) + 1
+
+    # Reconstruir los dict por tipo desde los arreglos, decodificando las claves
+    # a str una sola vez. De los strands solo cuentan "+" y "-" (como en los
+    # motores en C y Numba); ".", "?" u otros valores se descartan aquí
+    names = {k.decode("utf-8"): tid for k, tid in type_ids.items()}
+    return (
+        {name: cnt_arr[tid] for name, tid in names.items()},
+        {name: sum_arr[tid] for name, tid in names.items()},
+        {k.decode("utf-8"): v for k, v in strand_counts.items() if k in (b"+", b"-")},
+    )
+
+
+def _scan_gff(
+    path: str, filter_type: str | None = None, io_backend: str = "buffered"
+) -> Tuple[Dict, Dict, Dict]:
+    """Recorre el archivo GFF en Python puro y acumula los contadores crudos.
+
+    Es la implementación de respaldo cuando la extensión en C (_gff_stats)
+    no está compilada. Devuelve lo mismo que _scan_lines().
+
+    Con io_backend="uring" las líneas se obtienen de bloques leídos con
+    io_uring (si el sistema lo permite); en otro caso se usa la lectura con
+    buffer de 4 MB.
+    """
+    if io_backend == "uring" and _uring_reader is not None and _uring_reader.available():
+        # Bloques de 16 MB con varias lecturas io_uring en vuelo
+        source = contextlib.closing(_lines_from_chunks(_uring_reader.read_chunks(path)))
+    else:
+        # Abrir en modo binario con un buffer de 4 MB: menos llamadas a read() y
+        # sin la capa TextIOWrapper que decodifica UTF-8 cada línea. Se mantiene
+        # el objeto archivo (y no os.read() + split()) porque su iteración por
+        # líneas en C es más rápida que separar los bloques en Python.
+        source = open(path, "rb", buffering=_BUFFER_SIZE)
+
+    with source as fh:
+        return _scan_lines(fh, filter_type)
+
+
+def _chunk_ranges(path: str, n_workers: int) -> List[Tuple[int, int]]:
+    """Divide el archivo en hasta n_workers rangos de bytes [inicio, fin).
+
+    Cada frontera se avanza hasta el comienzo de la línea siguiente, de modo
+    que ninguna línea queda partida entre dos rangos.
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as fh:
+        for i in range(1, n_workers):
+            # Leer desde el byte anterior: si es "\n", pos ya es inicio de línea
+            fh.seek(max(size * i // n_workers - 1, 0))
+            fh.readline()
+            pos = fh.tell()
+            if bounds[-1] < pos < size:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _read_blocks(path: str, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+    """Lee el rango [start, end) del archivo (hasta el final si end es None).
+
+    Usa directamente os.open()/os.read() en bloques de 4 MB, sin la pila del
+    módulo io; las líneas se separan después con _lines_from_chunks().
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if start:
+            os.lseek(fd, start, os.SEEK_SET)
+        while end is None or start < end:
+            size = _BUFFER_SIZE if end is None else min(_BUFFER_SIZE, end - start)
+            block = os.read(fd, size)
+            if not block:
+                break
+            start += len(block)
+            yield block
+    finally:
+        os.close(fd)
+
+
+def _scan_chunk(path: str, start: int, end: int, filter_type: str | None = None) -> Tuple[Dict, Dict, Dict]:
+    """Procesa un rango de bytes del archivo (tarea de cada proceso trabajador)."""
+    return _scan_lines(_lines_from_chunks(_read_blocks(path, start, end)), filter_type)
+
+
+def _merge_partials(partials: Iterable[Tuple[Dict, Dict, Dict]]) -> Tuple[Dict, Dict, Dict]:
+    """Suma los contadores parciales de cada rango (la agregación es asociativa).
+
+    Los parciales se recorren en orden de rango, así los tipos conservan el
+    orden de primera aparición en el archivo.
+    """
+    merged = ({}, {}, {})
+    for partial in partials:
+        for total, part in zip(merged, partial):
+            for key, value in part.items():
+                total[key] = total.get(key, 0) + value
+    return merged
+
+
+def _scan_parallel(path: str, filter_type: str | None, workers: int) -> Tuple[Dict, Dict, Dict]:
+    """Reparte el archivo en rangos y los procesa en paralelo con varios procesos."""
+    ranges = _chunk_ranges(path, workers)
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        partials = executor.map(
+            _scan_chunk, [path] * len(ranges), starts, ends, [filter_type] * len(ranges)
+        )
+        return _merge_partials(partials)
+
+
+def _scan_range_c(fd: int, start: int, end: int, filter_type: str | None) -> Tuple[Dict, Dict, Dict]:
+    """Procesa el rango [start, end) con el Scanner en C (tarea de cada hilo).
+
+    os.pread() y Scanner.feed() liberan el GIL, así que varios hilos leen y
+    recorren sus rangos a la vez sobre el mismo descriptor de archivo.
+    """
+    scanner = _gff_stats.Scanner(filter_type)
+    offset = start
+    while offset < end:
+        block = os.pread(fd, min(_BUFFER_SIZE, end - offset), offset)
+        if not block:
+            break
+        scanner.feed(block)
+        offset += len(block)
+    return scanner.result()
+
+
+def _scan_uring_c(path: str, filter_type: str | None) -> Tuple[Dict, Dict, Dict]:
+    """Pasa los bloques leídos con io_uring al Scanner en C.
+
+    Mientras Scanner.feed() recorre un bloque (sin el GIL), las siguientes
+    lecturas de la cola siguen en vuelo.
+    """
+    scanner = _gff_stats.Scanner(filter_type)
+    for chunk in _uring_reader.read_chunks(path):
+        scanner.feed(chunk)
+    return scanner.result()
+
+
+def _scan_threaded(path: str, filter_type: str | None, workers: int) -> Tuple[Dict, Dict, Dict]:
+    """Reparte el archivo en rangos y los procesa con el núcleo en C en varios hilos."""
+    ranges = _chunk_ranges(path, workers)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            partials = executor.map(
+                lambda r: _scan_range_c(fd, r[0], r[1], filter_type), ranges
+            )
+            return _merge_partials(partials)
+    finally:
+        os.close(fd)
+
+
+def compute_stats_from_gff(
+    path: str,
+    filter_type: str | None = None,
+    io_backend: str = "buffered",
+    workers: int = 1,
+    cache: str | None = None,
+) -> Dict:
     """Analiza un archivo GFF y calcula estadísticas de features.
     
     Esta función realiza un análisis completo del archivo GFF, extrayendo información
@@ -57,6 +410,16 @@ def compute_stats_from_gff(path: str, filter_type: str | None = None) -> Dict:
         filter_type (str | None): Si se proporciona, solo analiza features de este tipo.
                                   Ejemplo: "gene", "CDS", "mRNA"
                                   Default: None (analiza todos los tipos)
+        io_backend (str): Forma de leer el archivo: "buffered" (por defecto) o
+                          "uring" (io_uring en Linux >= 5.6 con liburing; si no
+                          está disponible se usa "buffered")
+        workers (int): Número de hilos (con el núcleo en C) o procesos (sin él)
+                       para archivos grandes (>= 64 MB). Default: 1 (sin paralelismo)
+        cache (str | None): Archivo Parquet donde guardar los registros ya
+                            parseados. Si es más reciente que el GFF, se usa en
+                            lugar de volver a leer el texto (requiere pyarrow,
+                            numpy y numba; sin ellos se avisa con un
+                            RuntimeWarning y se lee el texto). Default: None
     
     Returns:
         Dict: Diccionario con las siguientes claves:
@@ -78,71 +441,58 @@ def compute_stats_from_gff(path: str, filter_type: str | None = None) -> Dict:
         >>> print(stats_cds["by_type"])
         {"CDS": 290}
     """
-    # Inicializar contenedores de datos usando defaultdict para evitar KeyError
-    total = 0  # Contador total de features válidos
-    counts = defaultdict(int)  # Conteo de features por tipo: {"gene": 2, "CDS": 3, ...}
-    length_sums = defaultdict(int)  # Suma acumulada de longitudes por tipo
-    strand_counts = defaultdict(int)  # Conteo de strands: {"+": N, "-": M, ".": K}
-
-    # Abrir y procesar el archivo GFF línea por línea
-    with open(path, "r", encoding="utf-8") as fh:
-        for line in fh:
-            # Eliminar espacios en blanco al inicio/final (incluye \n)
-            line = line.strip()
-            
-            # Saltar líneas vacías y líneas de comentario (comienzan con #)
-            if not line or line.startswith("#"):
-                continue
-            
-            # Dividir por tabulaciones para obtener las 9 columnas GFF
-            cols = line.split("\t")
-            
-            # Validar que haya suficientes columnas
-            if len(cols) < 9:
-                # Saltar líneas malformadas silenciosamente
-                continue
-            
-            # Extraer campos relevantes (GFF es 1-indexed en la documentación, 0-indexed aquí)
-            # Columna 2 (índice 2): feature type
-            feature_type = cols[2]
-            
-            # Aplicar filtro si se especificó: saltar si el tipo no coincide
-            if filter_type and feature_type != filter_type:
-                continue
-            
-            # Columnas 3 y 4 (índices 3 y 4): start y end positions
-            try:
-                start = int(cols[3])
-                end = int(cols[4])
-            except ValueError:
-                # Saltar si start o end no son números válidos
-                continue
-            
-            # Calcular longitud: end - start + 1 (ambos inclusive)
-            length = end - start + 1
-            
-            # Columna 6 (índice 6): strand (+ o -)
-            strand = cols[6]
+    # Elegir el motor de lectura: núcleo en C si está compilado, escáner Numba si
+    # está instalado, Python puro si no. Todos devuelven los mismos acumuladores
+    # (counts, length_sums, strand_counts). Con io_uring (si el sistema lo
+    # permite) los bloques leídos por la cola van al Scanner en C o, sin él, al
+    # escáner en Python; si io_uring no está disponible se sigue la elección
+    # normal. Los archivos grandes se reparten en rangos entre `workers` hilos
+    # (núcleo en C, que libera el GIL) o procesos (Python puro). Con `cache`,
+    # los registros se leen del archivo Parquet (o se guardan en él la primera vez)
+    parallel = workers > 1 and os.path.getsize(path) >= _PARALLEL_MIN_SIZE
+    uring = io_backend == "uring" and _uring_reader is not None and _uring_reader.available()
+    # Caché columnar en Parquet (ver _arrow_cache.py; requiere pyarrow, numpy y
+    # numba), importado solo si se pide
+    arrow_cache = _import_optional("_arrow_cache") if cache else None
+    if cache and arrow_cache is None:
+        warnings.warn(
+            f"--cache {cache} ignorado: el caché Parquet requiere pyarrow, numpy y numba",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    if arrow_cache is not None:
+        counts, length_sums, strand_counts = arrow_cache.compute(path, cache, filter_type)
+    elif uring and _gff_stats is not None:
+        counts, length_sums, strand_counts = _scan_uring_c(path, filter_type)
+    elif uring:
+        counts, length_sums, strand_counts = _scan_gff(path, filter_type, io_backend)
+    elif parallel and _gff_stats is not None:
+        counts, length_sums, strand_counts = _scan_threaded(path, filter_type, workers)
+    elif parallel:
+        counts, length_sums, strand_counts = _scan_parallel(path, filter_type, workers)
+    elif _gff_stats is not None:
+        counts, length_sums, strand_counts = _gff_stats.compute(path, filter_type)
+    else:
+        # Escáner compilado con Numba (ver _scan.py; requiere numpy y numba), que
+        # solo se importa aquí; si no está instalado, Python puro
+        numba_scan = _import_optional("_scan")
+        if numba_scan is not None:
+            counts, length_sums, strand_counts = numba_scan.compute(path, filter_type)
+        else:
+            counts, length_sums, strand_counts = _scan_gff(path, filter_type)
 
-            # Actualizar contadores
-            total += 1  # Incrementar contador total
-            counts[feature_type] += 1  # Incrementar conteo para este tipo
-            length_sums[feature_type] += length  # Acumular longitud para promedios
-            
-            # Incrementar conteo de strand (distingue +, -, .)
-            if strand in ("+", "-"):
-                strand_counts[strand] += 1
-            else:
-                # Para strands inválidos (.), inicializar si no existe
-                strand_counts.setdefault(".", 0)
+    # Número total de features válidos = suma de los conteos por tipo
+    total = sum(counts.values())
 
     # CÁLCULOS AGREGADOS USANDO COMPRENSIÓN DE LISTAS
 
     # 1. Calcular longitud promedio por tipo
     # Comprensión de diccionario: {tipo: promedio_redondeado}
     # Solo incluye tipos con al menos 1 feature (evita división por cero)
+    # Redondeo a 1 decimal con aritmética entera: (10*suma + n//2) // n da las
+    # décimas redondeadas (mitades hacia arriba) y /10 lo devuelve como float
     avg_length = {
-        k: round(length_sums[k] / counts[k], 1) for k in counts
+        k: ((length_sums[k] * 10 + counts[k] // 2) // counts[k]) / 10 for k in counts
     } if counts else {}
     # Resultado ejemplo: {"gene": 900.0, "CDS": 84.3, "mRNA": 150.0}
 
@@ -152,10 +502,12 @@ def compute_stats_from_gff(path: str, filter_type: str | None = None) -> Dict:
     
     if total_strands:
         # Calcular porcentaje para cada strand y redondear a entero
-        # Fórmula: (conteo / total) * 100, redondeado al entero más cercano
+        # Fórmula: (100 * conteo + total // 2) // total, el entero más cercano
+        # (mitades hacia arriba) sin pasar por float
+        half = total_strands // 2
         strand_distribution = {
-            "+": int(round(100 * strand_counts.get("+", 0) / total_strands)),
-            "-": int(round(100 * strand_counts.get("-", 0) / total_strands)),
+            "+": (100 * strand_counts.get("+", 0) + half) // total_strands,
+            "-": (100 * strand_counts.get("-", 0) + half) // total_strands,
         }
     else:
         # Si no hay strands válidos, inicializar con 0
@@ -165,7 +517,7 @@ def compute_stats_from_gff(path: str, filter_type: str | None = None) -> Dict:
     # 3. Construir diccionario de resultado
     result = {
         "total_features": total,  # Número total de features procesados
-        "by_type": dict(counts),  # Convertir defaultdict a dict normal
+        "by_type": dict(counts),  # Copia del conteo por tipo
         "avg_length": avg_length,  # Diccionario de promedios por tipo
         "strand_distribution": strand_distribution,  # Diccionario de porcentajes
     }
@@ -177,6 +529,17 @@ def compute_stats_from_gff(path: str, filter_type: str | None = None) -> Dict:
     return result
 
 
+def _positive_int(value: str) -> int:
+    """Tipo de argparse para --workers: entero >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {number}")
+    return number
+
+
 def cli(argv: list[str] | None = None) -> int:
     """Interfaz de línea de comandos (CLI) para analizar archivos GFF.
     
@@ -198,6 +561,24 @@ def cli(argv: list[str] | None = None) -> int:
             Filtro opcional para analizar solo un tipo de feature
             Default: None (analiza todos los tipos)
             Ejemplo: --filter-type CDS
+        
+        --io-backend {buffered,uring}
+            Forma de leer el archivo GFF
+            Default: "buffered" (lectura con buffer de 4 MB)
+            "uring": io_uring en Linux >= 5.6 (requiere el paquete liburing)
+            Ejemplo: --io-backend uring
+        
+        --workers N
+            Número de hilos/procesos para repartir archivos grandes (>= 64 MB)
+            Default: número de CPUs, como máximo 8
+            Ejemplo: --workers 4
+        
+        --cache CACHE_FILE
+            Archivo Parquet con los registros ya parseados; se crea en la primera
+            ejecución y se reutiliza mientras sea más reciente que el GFF
+            Default: None (sin caché; requiere pyarrow, numpy y numba, y si
+            faltan el CLI termina con error en lugar de ignorarlo)
+            Ejemplo: --cache genes.parquet
     
     Flujo de ejecución:
         1. Parsear argumentos de línea de comandos
@@ -257,21 +638,60 @@ def cli(argv: list[str] | None = None) -> int:
         help="Filter statistics by feature type (e.g., gene, CDS, mRNA)"
     )
     
+    # Argumento --io-backend: forma de leer el archivo GFF
+    parser.add_argument(
+        "--io-backend",
+        choices=("buffered", "uring"),
+        default="buffered",  # Lectura con buffer de 4 MB por defecto
+        help="How to read the GFF file: buffered (default) or uring (Linux io_uring)"
+    )
+    
+    # Argumento --workers: procesos para repartir archivos grandes
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,  # 0 o negativos se rechazan (no significan "en serie")
+        default=min(os.cpu_count() or 1, 8),  # CPUs disponibles, como máximo 8
+        help="Worker threads/processes for large GFF files (default: CPU count, max 8)"
+    )
+    
+    # Argumento --cache: caché Parquet de los registros parseados
+    parser.add_argument(
+        "--cache",
+        default=None,  # Sin caché por defecto
+        help="Parquet cache of parsed records, reused while newer than the GFF file"
+    )
+    
     # 2. PARSEAR LOS ARGUMENTOS
     # Si argv es None, argparse usará sys.argv automáticamente
     args = parser.parse_args(argv)
+    # Un --cache explícito sin sus dependencias es un error, no un aviso
+    if args.cache and _import_optional("_arrow_cache") is None:
+        parser.error("--cache requires pyarrow, numpy and numba")
 
     # 3. LLAMAR A LA FUNCIÓN DE CÁLCULO DE ESTADÍSTICAS
     # Pasar los argumentos parseados a compute_stats_from_gff()
-    stats = compute_stats_from_gff(args.gff, filter_type=args.filter_type)
+    stats = compute_stats_from_gff(
+        args.gff,
+        filter_type=args.filter_type,
+        io_backend=args.io_backend,
+        workers=args.workers,
+        cache=args.cache,
+    )
     
     # 4. ESCRIBIR RESULTADO A ARCHIVO JSON
-    # Abrir archivo en modo escritura con codificación UTF-8
-    with open(args.out, "w", encoding="utf-8") as outfh:
-        # json.dump(): serializar el diccionario de estadísticas a JSON
-        # indent=2: indentar con 2 espacios para legibilidad
-        # ensure_ascii=False: permitir caracteres no-ASCII (ej: ñ, á)
-        json.dump(stats, outfh, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson.dumps(): serializa directamente a bytes UTF-8 (sin escapar no-ASCII)
+        # OPT_INDENT_2: indentar con 2 espacios, igual que json.dump(indent=2)
+        payload = orjson.dumps(stats, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(args.out, "wb") as outfh:
+            outfh.write(payload)
+    else:
+        # Abrir archivo en modo escritura con codificación UTF-8
+        with open(args.out, "w", encoding="utf-8") as outfh:
+            # json.dump(): serializar el diccionario de estadísticas a JSON
+            # indent=2: indentar con 2 espacios para legibilidad
+            # ensure_ascii=False: permitir caracteres no-ASCII (ej: ñ, á)
+            json.dump(stats, outfh, indent=2, ensure_ascii=False)
 
     # 5. RETORNAR CÓDIGO DE ESTADO
     return 0  # 0 = éxito
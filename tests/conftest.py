@@ -0,0 +1,29 @@
+"""Configuración compartida de pytest
+
+Añade src/ al inicio de sys.path para que los tests puedan hacer
+`import gff_stats` como un módulo normal (y, si están disponibles, que
+gff_stats encuentre sus motores opcionales _gff_stats, _scan y _uring_reader).
+
+Con la variable de entorno GFF_STATS_REQUIRE_C=1 (p. ej. en CI, después de
+`python setup.py build_ext --inplace`), la sesión falla si el núcleo en C no
+está compilado, en lugar de omitir en silencio los tests que lo usan.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+
+def pytest_sessionstart(session):
+    """Comprueba que el núcleo en C esté compilado si se exige."""
+    if os.environ.get("GFF_STATS_REQUIRE_C") == "1":
+        try:
+            import _gff_stats  # noqa: F401
+        except ImportError as exc:
+            raise pytest.UsageError(
+                "GFF_STATS_REQUIRE_C=1 pero la extensión _gff_stats no está "
+                "compilada (python setup.py build_ext --inplace): " + str(exc)
+            )
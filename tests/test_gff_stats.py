@@ -9,7 +9,7 @@ gff_stats.py funciona correctamente. Las pruebas cubren:
 4. Validación de valores calculados (promedios, distribuciones, etc.)
 
 Estructura:
-- load_module(): función auxiliar para importar dinámicamente el módulo bajo prueba
+- conftest.py: añade src/ a sys.path para importar gff_stats de forma normal
 - test_*: funciones de prueba (pytest detecta automáticamente funciones que comienzan con test_)
 
 Datos de prueba:
@@ -17,44 +17,19 @@ Datos de prueba:
   Contenido: 2 genes, 3 CDS, 1 mRNA (combinación de + y -)
 """
 import json
-import importlib.util
+import os
+import threading
 from pathlib import Path
 
+import pytest
+
+# conftest.py añade src/ a sys.path: el módulo se importa una sola vez por sesión
+import gff_stats as mod
+
 
 # CONFIGURACIÓN DE RUTAS
 # Obtener la ruta raíz del proyecto (directorio padre de tests/)
 ROOT = Path(__file__).resolve().parents[1]
-# Ruta al módulo bajo prueba
-SRC_PATH = ROOT / "src" / "gff_stats.py"
-
-
-def load_module():
-    """Carga dinámicamente el módulo gff_stats.py usando importlib.
-    
-    Esta función es necesaria porque:
-    - pytest ejecuta tests desde un directorio diferente
-    - Necesitamos cargar el módulo desde una ruta específica
-    - Permite recargar el módulo en cada test (evita efectos secundarios entre tests)
-    
-    Internals (importlib):
-        1. spec_from_file_location(): crea una especificación del módulo desde archivo
-        2. module_from_spec(): crea un módulo vacío basado en la especificación
-        3. exec_module(): ejecuta el código del módulo en el namespace del módulo
-    
-    Returns:
-        module: Módulo gff_stats cargado y listo para usar
-        
-    Ejemplo:
-        >>> mod = load_module()
-        >>> stats = mod.compute_stats_from_gff("datos.gff")
-    """
-    # Crear especificación del módulo desde la ruta del archivo
-    spec = importlib.util.spec_from_file_location("gff_stats", str(SRC_PATH))
-    # Crear módulo vacío basado en la especificación
-    mod = importlib.util.module_from_spec(spec)
-    # Ejecutar el código del módulo en el namespace del módulo
-    spec.loader.exec_module(mod)
-    return mod
 
 
 def test_compute_stats_from_sample():
@@ -84,8 +59,6 @@ def test_compute_stats_from_sample():
           * % +: 4 / 6 * 100 = 66.67% ≈ 67 (redondeado)
           * % -: 2 / 6 * 100 = 33.33% ≈ 33 (redondeado)
     """
-    # Cargar módulo dinámicamente
-    mod = load_module()
     # Obtener ruta del archivo de prueba
     sample = ROOT / "data" / "sample.gff"
     # Llamar función bajo prueba (sin filtro)
@@ -99,9 +72,8 @@ def test_compute_stats_from_sample():
     assert stats["avg_length"]["gene"] == 900.0
     assert stats["avg_length"]["CDS"] == 84.3
     assert stats["avg_length"]["mRNA"] == 150.0
-    # strand distribution: + = 4, - = 2 -> 67 and 33 (rounded)
-    assert stats["strand_distribution"]["+"] in (66, 67, 67)
-    assert stats["strand_distribution"]["-"] in (33, 34, 33)
+    # strand distribution: + = 4, - = 2 -> 67 and 33 (rounded, integer math)
+    assert stats["strand_distribution"] == {"+": 67, "-": 33}
 
 
 def test_compute_stats_with_filter():
@@ -122,8 +94,6 @@ def test_compute_stats_with_filter():
         - filter_type: debe estar presente en el resultado
         - strand_distribution: se recalcula solo para features filtrados
     """
-    # Cargar módulo dinámicamente
-    mod = load_module()
     # Obtener ruta del archivo de prueba
     sample = ROOT / "data" / "sample.gff"
     
@@ -156,16 +126,13 @@ def test_cli_writes_json(tmp_path):
                   Útil para evitar conflictos de archivos en tests paralelos
     
     Flujo:
-        1. Cargar módulo
-        2. Preparar rutas: archivo de entrada (sample.gff) y salida (JSON temporal)
-        3. Llamar cli() con argumentos personalizados
-        4. Verificar que:
+        1. Preparar rutas: archivo de entrada (sample.gff) y salida (JSON temporal)
+        2. Llamar cli() con argumentos personalizados
+        3. Verificar que:
            - cli() retorna 0 (éxito)
            - Archivo de salida existe
            - JSON es válido y contiene campos esperados
     """
-    # Cargar módulo dinámicamente
-    mod = load_module()
     # Ruta del archivo de entrada
     sample = ROOT / "data" / "sample.gff"
     # Ruta del archivo de salida (en directorio temporal proporcionado por pytest)
@@ -197,8 +164,6 @@ def test_cli_with_filter(tmp_path):
            - by_type contiene solo CDS
            - filter_type está presente en JSON
     """
-    # Cargar módulo dinámicamente
-    mod = load_module()
     # Ruta del archivo de entrada
     sample = ROOT / "data" / "sample.gff"
     # Ruta del archivo de salida (en directorio temporal)
@@ -211,3 +176,406 @@ def test_cli_with_filter(tmp_path):
     assert data["total_features"] == 3
     assert data["by_type"] == {"CDS": 3}
     assert data["filter_type"] == "CDS"
+
+
+def test_c_backend_matches_python():
+    """Test: Verificar que el núcleo en C produce los mismos contadores que Python.
+    
+    Objetivo:
+        Si la extensión _gff_stats está compilada, compute() debe devolver
+        exactamente los mismos acumuladores que _scan_gff() (la versión en
+        Python puro), con y sin filtro. Si no está compilada, se omite.
+    """
+    if mod._gff_stats is None:
+        pytest.skip("extensión _gff_stats no compilada")
+    
+    for name in ("sample.gff", "sample2.gff"):
+        sample = str(ROOT / "data" / name)
+        for filter_type in (None, "CDS", "gene"):
+            counts, length_sums, strand_counts = mod._gff_stats.compute(sample, filter_type)
+            py_counts, py_length_sums, py_strands = mod._scan_gff(sample, filter_type)
+            assert counts == py_counts
+            assert length_sums == py_length_sums
+            assert strand_counts == py_strands
+
+
+def test_engines_strip_lines_like_baseline(tmp_path):
+    """Test: Verificar que el escáner en Python limpia cada línea como el núcleo en C.
+    
+    Objetivo:
+        Cada línea se limpia con strip() antes de validarla: un registro con la
+        columna de atributos vacía (termina en tab) tiene solo 8 columnas y se
+        ignora, un comentario con sangría sigue siendo comentario y un tab al
+        inicio no desplaza las columnas. El núcleo en C y el escáner Numba (si
+        están disponibles) deben dar los mismos contadores.
+    """
+    gff = tmp_path / "strip.gff"
+    gff.write_bytes(
+        b"c1\ts\tgene\t1\t100\t.\t+\t.\tID=g1\n"
+        b"c1\ts\tgene\t1\t100\t.\t+\t.\t\n"  # atributos vacíos: se ignora
+        b"c1\ts\tCDS\t1\t10\t.\t-\t0\tID=c1   \n"
+        b"  #c1\ts\tgene\t1\t5\t.\t+\t.\tcomentario\n"  # comentario con sangría
+        b"\tc1\ts\tCDS\t1\t10\t.\t-\t0\tID=c2\n"  # tab inicial
+    )
+    
+    expected = {
+        None: ({"gene": 1, "CDS": 2}, {"gene": 100, "CDS": 20}, {"+": 1, "-": 2}),
+        "CDS": ({"CDS": 2}, {"CDS": 20}, {"-": 2}),
+        "gene": ({"gene": 1}, {"gene": 100}, {"+": 1}),
+    }
+    numba_scan = mod._import_optional("_scan")
+    for filter_type, result in expected.items():
+        assert mod._scan_gff(str(gff), filter_type) == result
+        if mod._gff_stats is not None:
+            assert mod._gff_stats.compute(str(gff), filter_type) == result
+        if numba_scan is not None:
+            assert numba_scan.compute(str(gff), filter_type) == result
+
+
+# Archivo con los casos límite que la versión original resuelve con strip() e
+# int(): finales CRLF, un registro con atributos vacíos (termina en tab), un
+# comentario con sangría, enteros con espacios o signo, strand "." y una última
+# línea sin salto de línea. Además, coordenadas de más de 18 cifras
+# significativas, que todos los motores descartan (la versión original las
+# contaba, pero no caben en los acumuladores int64)
+EDGE_GFF = (
+    b"##gff-version 3\r\n"
+    b"c1\ts\tgene\t1\t100\t.\t+\t.\tID=g1\r\n"
+    b"c1\ts\tCDS\t 11 \t20\t.\t-\t0\tID=c1\r\n"
+    b"c1\ts\tgene\t1\t100\t.\t+\t.\t\n"  # atributos vacíos: se ignora
+    b"   # c1\ts\tgene\t1\t5\t.\t+\t.\tcomentario\n"  # comentario con sangría
+    b"c1\ts\tmRNA\t5\t54\t.\t.\t.\tID=m1\n"  # strand "."
+    b"\n"
+    b"c1\ts\tgene\tx\t9\t.\t+\t.\tID=bad\n"  # start no numérico: se ignora
+    b"c1\ts\tCDS\t1\t2\n"  # menos de 9 columnas: se ignora
+    b"c1\ts\tgene\t1\t99999999999999999999\t.\t+\t.\tID=huge\n"  # 20 cifras: se ignora
+    b"c1\ts\tregion\t0000000000000000001\t100\t.\t.\t.\tID=r1\n"  # ceros a la izquierda: 1 cifra
+    b"c1\ts\tregion\t1\t999999999999999999\t.\t.\t.\tID=r2\n"  # 18 cifras: suma > 2**53
+    b"c1\ts\tCDS\t+21\t 40\t.\t+\t0\tID=c2"
+)
+
+# Acumuladores (counts, length_sums, strand_counts) que da la versión original
+# sobre EDGE_GFF, por filtro (salvo la línea de 20 cifras, que se descarta)
+EDGE_EXPECTED = {
+    None: (
+        {"gene": 1, "CDS": 2, "mRNA": 1, "region": 2},
+        {"gene": 100, "CDS": 30, "mRNA": 50, "region": 1000000000000000099},
+        {"+": 2, "-": 1},
+    ),
+    "CDS": ({"CDS": 2}, {"CDS": 30}, {"+": 1, "-": 1}),
+    "mRNA": ({"mRNA": 1}, {"mRNA": 50}, {}),
+    "gene": ({"gene": 1}, {"gene": 100}, {"+": 1}),
+    "region": ({"region": 2}, {"region": 1000000000000000099}, {}),
+}
+
+
+def test_all_engines_match_baseline_on_edge_cases(tmp_path):
+    """Test: Verificar que todos los motores disponibles coinciden en casos límite.
+    
+    Objetivo:
+        Sobre EDGE_GFF, cada motor (Python, núcleo en C, Scanner en C, hilos,
+        procesos, Numba, io_uring y caché Parquet, los que estén disponibles)
+        debe devolver exactamente los acumuladores de la versión original, y
+        compute_stats_from_gff() el mismo diccionario final.
+    """
+    gff = tmp_path / "edge.gff"
+    gff.write_bytes(EDGE_GFF)
+    path = str(gff)
+    
+    engines = {
+        "python": lambda ft: mod._scan_gff(path, ft),
+        "processes": lambda ft: mod._scan_parallel(path, ft, 2),
+    }
+    if mod._uring_reader is not None and mod._uring_reader.available():
+        engines["python-uring"] = lambda ft: mod._scan_gff(path, ft, "uring")
+    if mod._gff_stats is not None:
+        engines["c"] = lambda ft: mod._gff_stats.compute(path, ft)
+        engines["c-threads"] = lambda ft: mod._scan_threaded(path, ft, 3)
+        if mod._uring_reader is not None and mod._uring_reader.available():
+            engines["c-uring"] = lambda ft: mod._scan_uring_c(path, ft)
+    numba_scan = mod._import_optional("_scan")
+    if numba_scan is not None:
+        engines["numba"] = lambda ft: numba_scan.compute(path, ft)
+    arrow_cache = mod._import_optional("_arrow_cache")
+    if arrow_cache is not None:
+        cache = str(tmp_path / "edge.parquet")
+        engines["parquet-cache"] = lambda ft: arrow_cache.compute(path, cache, ft)
+    
+    for filter_type, expected in EDGE_EXPECTED.items():
+        for name, engine in engines.items():
+            assert engine(filter_type) == expected, name
+    
+    assert mod.compute_stats_from_gff(path) == {
+        "total_features": 6,
+        "by_type": {"gene": 1, "CDS": 2, "mRNA": 1, "region": 2},
+        "avg_length": {"gene": 100.0, "CDS": 15.0, "mRNA": 50.0, "region": 500000000000000049.5},
+        "strand_distribution": {"+": 67, "-": 33},
+    }
+
+
+def test_numba_backend_matches_python():
+    """Test: Verificar que el escáner Numba produce los mismos contadores que Python.
+    
+    Objetivo:
+        Si numpy y numba están instalados, _scan.compute() debe devolver los
+        mismos acumuladores que _scan_gff(), con y sin filtro. Si no, se omite.
+    """
+    numba_scan = mod._import_optional("_scan")
+    if numba_scan is None:
+        pytest.skip("numpy/numba no instalados")
+    
+    for name in ("sample.gff", "sample2.gff"):
+        sample = str(ROOT / "data" / name)
+        for filter_type in (None, "CDS", "gene"):
+            counts, length_sums, strand_counts = numba_scan.compute(sample, filter_type)
+            py_counts, py_length_sums, py_strands = mod._scan_gff(sample, filter_type)
+            assert counts == py_counts
+            assert length_sums == py_length_sums
+            assert strand_counts == py_strands
+
+
+def test_uring_backend_same_result():
+    """Test: Verificar que --io-backend uring no cambia el resultado.
+    
+    Objetivo:
+        compute_stats_from_gff() con io_backend="uring" debe dar exactamente el
+        mismo diccionario que la lectura por defecto. Si io_uring no está
+        disponible se usa la lectura con buffer, y el resultado sigue igual.
+    """
+    
+    for name in ("sample.gff", "sample2.gff"):
+        sample = str(ROOT / "data" / name)
+        for filter_type in (None, "CDS"):
+            expected = mod.compute_stats_from_gff(sample, filter_type=filter_type)
+            stats = mod.compute_stats_from_gff(sample, filter_type=filter_type, io_backend="uring")
+            assert stats == expected
+
+
+def test_uring_backend_uses_c_core_and_falls_back(monkeypatch):
+    """Test: Verificar qué motor se usa con --io-backend uring.
+    
+    Objetivo:
+        Con la extensión en C, los bloques de io_uring van a Scanner.feed()
+        (_scan_uring_c) y dan lo mismo que _gff_stats.compute(). Si io_uring no
+        está disponible, se sigue la elección normal de motor en lugar de caer
+        siempre en el bucle en Python.
+    """
+    sample = str(ROOT / "data" / "sample2.gff")
+    expected = mod.compute_stats_from_gff(sample)
+    
+    if mod._gff_stats is not None and mod._uring_reader is not None and mod._uring_reader.available():
+        for filter_type in (None, "CDS"):
+            assert mod._scan_uring_c(sample, filter_type) == mod._gff_stats.compute(sample, filter_type)
+    
+    if mod._uring_reader is not None:
+        monkeypatch.setattr(mod._uring_reader, "available", lambda: False)
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("io_uring no disponible: no debe usarse el bucle en Python")
+    
+    if mod._gff_stats is not None:
+        monkeypatch.setattr(mod, "_scan_gff", fail)
+    assert mod.compute_stats_from_gff(sample, io_backend="uring") == expected
+
+
+def test_chunk_ranges_merge_like_single_scan():
+    """Test: Verificar que procesar el archivo por rangos da el mismo resultado.
+    
+    Objetivo:
+        _chunk_ranges() debe cubrir el archivo completo con rangos contiguos
+        alineados a inicio de línea, y la suma de los parciales de _scan_chunk()
+        (lo que hace cada proceso con --workers) debe coincidir con _scan_gff().
+    """
+    sample = str(ROOT / "data" / "sample2.gff")
+    
+    for workers in (1, 2, 3, 7):
+        ranges = mod._chunk_ranges(sample, workers)
+        # Rangos contiguos que empiezan en 0 y terminan al final del archivo
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == Path(sample).stat().st_size
+        assert all(prev[1] == cur[0] for prev, cur in zip(ranges, ranges[1:]))
+        
+        for filter_type in (None, "CDS"):
+            partials = [mod._scan_chunk(sample, start, end, filter_type) for start, end in ranges]
+            assert mod._merge_partials(partials) == mod._scan_gff(sample, filter_type)
+
+
+def test_scan_parallel_matches_single_scan():
+    """Test: Verificar el reparto entre procesos de _scan_parallel().
+    
+    Objetivo:
+        compute_stats_from_gff() solo usa procesos con archivos >= 64 MB, así que
+        se llama a _scan_parallel() directamente: el ProcessPoolExecutor debe dar
+        los mismos contadores que _scan_gff().
+    """
+    sample = str(ROOT / "data" / "sample2.gff")
+    
+    for filter_type in (None, "CDS"):
+        assert mod._scan_parallel(sample, filter_type, 2) == mod._scan_gff(sample, filter_type)
+
+
+def test_cli_rejects_non_positive_workers(tmp_path):
+    """Test: Verificar que --workers no admite 0 ni negativos.
+    
+    Objetivo:
+        argparse debe terminar con error (SystemExit 2) en lugar de tratar esos
+        valores como "sin paralelismo".
+    """
+    sample = ROOT / "data" / "sample.gff"
+    out = tmp_path / "out.json"
+    
+    for value in ("0", "-3", "dos"):
+        with pytest.raises(SystemExit) as excinfo:
+            mod.cli(["--gff", str(sample), "--out", str(out), "--workers", value])
+        assert excinfo.value.code == 2
+    assert not out.exists()
+
+
+def test_c_scanner_threaded_matches_compute():
+    """Test: Verificar el Scanner incremental en C y el recorrido con hilos.
+    
+    Objetivo:
+        Alimentar Scanner.feed() con bloques pequeños (que parten líneas por la
+        mitad) y repartir el archivo entre varios hilos con _scan_threaded()
+        debe dar los mismos contadores que _gff_stats.compute(). Si la
+        extensión no está compilada, se omite.
+    """
+    if mod._gff_stats is None:
+        pytest.skip("extensión _gff_stats no compilada")
+    
+    sample = str(ROOT / "data" / "sample2.gff")
+    data = Path(sample).read_bytes()
+    for filter_type in (None, "CDS"):
+        expected = mod._gff_stats.compute(sample, filter_type)
+        
+        # Bloques de 7 bytes: casi todas las líneas quedan partidas entre dos feed()
+        scanner = mod._gff_stats.Scanner(filter_type)
+        for i in range(0, len(data), 7):
+            scanner.feed(data[i:i + 7])
+        assert scanner.result() == expected
+        
+        for workers in (2, 3):
+            assert mod._scan_threaded(sample, filter_type, workers) == expected
+
+
+def test_parquet_cache_same_result(tmp_path):
+    """Test: Verificar que --cache no cambia el resultado.
+    
+    Objetivo:
+        La primera llamada con cache crea el archivo Parquet; las siguientes lo
+        leen en lugar del GFF, con cualquier filtro, siempre que el caché venga
+        de ese mismo GFF. Todas deben dar el mismo diccionario que el recorrido
+        normal. Si pyarrow/numpy/numba no están
+        instalados, se omite.
+    """
+    if mod._import_optional("_arrow_cache") is None:
+        pytest.skip("pyarrow/numpy/numba no instalados")
+    
+    sample = str(ROOT / "data" / "sample2.gff")
+    cache = tmp_path / "sample2.parquet"
+    
+    # Caché inexistente: se parsea el GFF y se escribe el Parquet
+    assert mod.compute_stats_from_gff(sample, cache=str(cache)) == mod.compute_stats_from_gff(sample)
+    assert cache.exists()
+    
+    # Caché vigente: se usa con otros filtros sin volver a leer el GFF
+    for filter_type in (None, "CDS", "gene"):
+        expected = mod.compute_stats_from_gff(sample, filter_type=filter_type)
+        assert mod.compute_stats_from_gff(sample, filter_type=filter_type, cache=str(cache)) == expected
+    
+    # El mismo archivo de caché con otro GFF (aunque el caché sea más reciente)
+    # no debe reutilizarse: los metadatos de origen no coinciden y se reconstruye
+    other = tmp_path / "other.gff"
+    other.write_bytes(
+        b"c1\ts\tgene\t1\t100\t.\t+\t.\tID=g1\r\n"
+        b"c1\ts\tgene\t1\t100\t.\t+\t.\t\n"  # atributos vacíos: se ignora
+        b"c1\ts\tCDS\t1\t10\t.\t-\t0\tID=c1\n"
+    )
+    cache_mtime = cache.stat().st_mtime_ns
+    os.utime(other, ns=(cache_mtime - 10**9, cache_mtime - 10**9))
+    for filter_type in (None, "CDS"):
+        expected = mod.compute_stats_from_gff(str(other), filter_type=filter_type)
+        assert mod.compute_stats_from_gff(str(other), filter_type=filter_type, cache=str(cache)) == expected
+    assert mod.compute_stats_from_gff(str(other), cache=str(cache))["by_type"] == {"gene": 1, "CDS": 1}
+    
+    # Las escrituras usan temporales con nombre único y no dejan restos
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["other.gff", "sample2.parquet"]
+
+
+def test_cache_without_dependencies_is_reported(tmp_path, monkeypatch):
+    """Test: Verificar que un --cache sin pyarrow/numpy/numba no se ignora en silencio.
+    
+    Objetivo:
+        compute_stats_from_gff() avisa con RuntimeWarning (y da el resultado
+        normal sin escribir caché) y el CLI termina con error de argumentos.
+    """
+    real_import = mod._import_optional
+    monkeypatch.setattr(
+        mod, "_import_optional",
+        lambda name: None if name == "_arrow_cache" else real_import(name),
+    )
+    sample = str(ROOT / "data" / "sample2.gff")
+    cache = tmp_path / "sample2.parquet"
+    
+    with pytest.warns(RuntimeWarning, match="pyarrow"):
+        stats = mod.compute_stats_from_gff(sample, cache=str(cache))
+    assert stats == mod.compute_stats_from_gff(sample)
+    assert not cache.exists()
+    
+    with pytest.raises(SystemExit) as exc:
+        mod.cli(["--gff", sample, "--out", str(tmp_path / "out.json"), "--cache", str(cache)])
+    assert exc.value.code == 2
+    assert not (tmp_path / "out.json").exists()
+
+
+def test_c_scanner_rejects_concurrent_use_and_reinit_resets():
+    """Test: Verificar las protecciones del Scanner en C.
+    
+    Objetivo:
+        - Alimentar un mismo Scanner desde varios hilos: cada feed() o se
+          completa entero o lanza RuntimeError; nunca se pierden ni se mezclan
+          líneas (el resultado es exactamente el de los bloques aceptados).
+        - Volver a llamar a __init__() descarta la tabla, la línea pendiente y
+          el filtro anteriores.
+    Si la extensión no está compilada, se omite.
+    """
+    if mod._gff_stats is None:
+        pytest.skip("extensión _gff_stats no compilada")
+    
+    # Bloques de líneas completas: el resultado esperado es proporcional al
+    # número de feed() que se completaron
+    block = (ROOT / "data" / "sample2.gff").read_bytes() * 200
+    per_block = mod._gff_stats.Scanner()
+    per_block.feed(block)
+    counts, length_sums, strands = per_block.result()
+    
+    scanner = mod._gff_stats.Scanner()
+    accepted = []
+    
+    def worker():
+        for _ in range(20):
+            try:
+                scanner.feed(block)
+                accepted.append(1)
+            except RuntimeError:
+                pass
+    
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    n = len(accepted)
+    assert scanner.result() == (
+        {k: v * n for k, v in counts.items()},
+        {k: v * n for k, v in length_sums.items()},
+        {k: v * n for k, v in strands.items()},
+    )
+    
+    # __init__() de nuevo: sin restos del recorrido ni del filtro anterior
+    scanner = mod._gff_stats.Scanner("CDS")
+    scanner.feed(b"c1\ts\tCDS\t1\t5\t.\t+\t0\tx\nc1\ts\tgene\t1\t")
+    scanner.__init__(None)
+    scanner.feed(b"c1\ts\tgene\t1\t5\t.\t-\t.\tx\n")
+    assert scanner.result() == ({"gene": 1}, {"gene": 5}, {"-": 1})